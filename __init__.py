@@ -1,13 +1,35 @@
 """Somfy UAI+ Integration"""
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import device_registry as dr
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.helpers import config_validation as cv, device_registry as dr
 from homeassistant.helpers.reload import async_setup_reload_service
 
 from .coordinator import SomfyUaiPlusCoordinator
 
-from .const import DOMAIN, PLATFORMS
+from .const import DEFAULT_MAX_UPDATE_INTERVAL_SECONDS, DOMAIN, PLATFORMS
+from .dispatcher import COMMANDS, async_dispatch
+from .profiling import async_profile
+
+SERVICE_PROFILE = "profile"
+SERVICE_MOVE_COVERS = "move_covers"
+
+PROFILE_SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("seconds", default=60): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=3600)
+        ),
+    }
+)
+
+MOVE_COVERS_SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_ids,
+        vol.Required("command"): vol.In(list(COMMANDS)),
+    }
+)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -26,7 +48,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if group_ids == None:
         group_ids = []
 
-    coordinator = SomfyUaiPlusCoordinator(hass, host, username, password, target_ids, group_ids)
+    group_members = entry.options.get("group_members")
+    if group_members == None:
+        group_members = {}
+
+    dual_session: bool = entry.options.get("dual_session", False)
+
+    max_update_interval: int = entry.options.get(
+        "max_update_interval", DEFAULT_MAX_UPDATE_INTERVAL_SECONDS
+    )
+
+    coordinator = SomfyUaiPlusCoordinator(
+        hass,
+        host,
+        username,
+        password,
+        target_ids,
+        group_ids,
+        dual_session,
+        group_members,
+        max_update_interval,
+    )
     coordinator.connect_and_stay_connected()
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
@@ -48,6 +90,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
+    if not hass.services.has_service(DOMAIN, SERVICE_PROFILE):
+
+        async def async_handle_profile(call: ServiceCall) -> None:
+            await async_profile(hass, call.data["seconds"])
+
+        hass.services.async_register(
+            DOMAIN, SERVICE_PROFILE, async_handle_profile, PROFILE_SERVICE_SCHEMA
+        )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_MOVE_COVERS):
+
+        async def async_handle_move_covers(call: ServiceCall) -> None:
+            await async_dispatch(hass, call.data["entity_id"], call.data["command"])
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_MOVE_COVERS,
+            async_handle_move_covers,
+            MOVE_COVERS_SERVICE_SCHEMA,
+        )
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
@@ -68,4 +131,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+        if len(hass.data[DOMAIN]) == 0:
+            hass.services.async_remove(DOMAIN, SERVICE_PROFILE)
+            hass.services.async_remove(DOMAIN, SERVICE_MOVE_COVERS)
     return unload_ok
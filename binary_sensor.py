@@ -60,3 +60,13 @@ class SomfyUaiPlusConnectionSensor(CoordinatorEntity, BinarySensorEntity):
         """Set state from coordinator"""
         coordinator: SomfyUaiPlusCoordinator = self.coordinator
         self._attr_is_on = coordinator.is_connection_ready
+
+        # Command and read cache counters change with every command, so they
+        # are left to diagnostics rather than recorded as state here
+        self._attr_extra_state_attributes = {
+            "update_interval_seconds": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval is not None
+                else None
+            ),
+        }
@@ -0,0 +1,169 @@
+"""Somfy UAI+ command queue"""
+
+from __future__ import annotations
+import asyncio
+from async_timeout import timeout
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import logging
+
+_LOGGER = logging.getLogger("somfy_uai_plus")
+
+
+@dataclass
+class QueuedCommand:
+    """Command waiting to be sent to the UAI+."""
+
+    target_id: str
+    name: str
+    async_send: Callable[[], Awaitable[None]]
+    deadline: float
+    future: asyncio.Future
+
+
+class SomfyUaiPlusCommandQueue:
+    """Fair, deadline-aware queue of commands bound for the UAI+.
+
+    Each target holds at most one pending command. A newer command for the same
+    target supersedes the pending one but keeps its place in line, so targets are
+    served round-robin in the order they first asked and only the most recent
+    intent for each target reaches the motors.
+    """
+
+    def __init__(
+        self, async_wait_for_connection_ready: Callable[[], Awaitable[None]]
+    ) -> None:
+        """Initialize."""
+        self._async_wait_for_connection_ready = async_wait_for_connection_ready
+        self._pending: OrderedDict[str, QueuedCommand] = OrderedDict()
+        self._wakeup: asyncio.Event = asyncio.Event()
+        self._worker_task: asyncio.Task = None
+        self._stats: dict[str, int] = {
+            "sent": 0,
+            "failed": 0,
+            "superseded": 0,
+            "expired": 0,
+        }
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Gets counts of sent, failed and dropped commands."""
+        return dict(self._stats)
+
+    @property
+    def pending_count(self) -> int:
+        """Gets the number of commands waiting to be sent."""
+        return len(self._pending)
+
+    async def async_submit(
+        self,
+        target_id: str,
+        name: str,
+        async_send: Callable[[], Awaitable[None]],
+        timeout_seconds: float,
+    ) -> bool:
+        """Queue a command and wait until it is sent or dropped.
+
+        Returns True if the command was sent, or False if it was dropped.
+        """
+        loop = asyncio.get_running_loop()
+        command = QueuedCommand(
+            target_id=target_id,
+            name=name,
+            async_send=async_send,
+            deadline=loop.time() + timeout_seconds,
+            future=loop.create_future(),
+        )
+
+        previous_command = self._pending.get(target_id)
+        if previous_command is not None:
+            self._stats["superseded"] += 1
+            _LOGGER.debug(
+                f"Command {previous_command.name} for {target_id} superseded by {name}."
+            )
+            self._drop(previous_command)
+
+        # Replacing an existing key keeps the target's place in line.
+        self._pending[target_id] = command
+        self._wakeup.set()
+
+        if self._worker_task is None or self._worker_task.done():
+            self._worker_task = asyncio.create_task(self._async_run())
+
+        return await command.future
+
+    async def async_stop(self) -> None:
+        """Stop sending and drop all pending commands."""
+        if self._worker_task is not None:
+            self._worker_task.cancel()
+            try:
+                await self._worker_task
+            except asyncio.CancelledError:
+                pass
+            self._worker_task = None
+
+        while self._pending:
+            _, command = self._pending.popitem(last=False)
+            self._drop(command)
+
+    async def _async_run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            # Wait for the connection before taking the command off the queue,
+            # so that a command superseded in the meantime is never sent
+            target_id, command = next(iter(self._pending.items()))
+            if command.future.done():
+                del self._pending[target_id]
+                continue
+
+            try:
+                remaining = command.deadline - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                async with timeout(remaining):
+                    await self._async_wait_for_connection_ready()
+            except asyncio.TimeoutError:
+                if self._pending.get(target_id) is command:
+                    del self._pending[target_id]
+                    self._expire(command)
+                continue
+
+            _, command = self._pending.popitem(last=False)
+            if command.future.done():
+                continue
+            if command.deadline <= loop.time():
+                self._expire(command)
+                continue
+
+            try:
+                await command.async_send()
+            except Exception as err:  # pylint: disable=broad-except
+                self._stats["failed"] += 1
+                if not command.future.done():
+                    command.future.set_exception(err)
+            else:
+                self._stats["sent"] += 1
+                if not command.future.done():
+                    command.future.set_result(True)
+            finally:
+                # Already off the queue, so if the send was cancelled by
+                # async_stop nothing else would resolve it
+                self._drop(command)
+
+    def _expire(self, command: QueuedCommand) -> None:
+        self._stats["expired"] += 1
+        _LOGGER.warning(
+            f"Command {command.name} for {command.target_id} dropped after its deadline passed."
+        )
+        self._drop(command)
+
+    @staticmethod
+    def _drop(command: QueuedCommand) -> None:
+        if not command.future.done():
+            command.future.set_result(False)
@@ -1,13 +1,17 @@
 """Config flow"""
 
 from __future__ import annotations
+import asyncio
 from async_timeout import timeout
+from contextlib import suppress
+import ipaddress
 import logging
 import re
 import string
 import voluptuous as vol
 
 from homeassistant import config_entries, exceptions
+from homeassistant.components import network
 from homeassistant.const import (
     CONF_HOST,
     CONF_USERNAME,
@@ -26,7 +30,17 @@ from somfy_uai_plus_telnet.telnet_client import (
     InvalidPasswordException,
 )
 
-from .const import DOMAIN
+from .const import (
+    BASE_UPDATE_INTERVAL_SECONDS,
+    DEFAULT_MAX_UPDATE_INTERVAL_SECONDS,
+    DISCOVERY_CONCURRENCY,
+    DISCOVERY_MAX_HOSTS,
+    DISCOVERY_PROBE_TIMEOUT_SECONDS,
+    DOMAIN,
+    MAX_UPDATE_INTERVAL_LIMIT_SECONDS,
+    REACHABILITY_PROBE_TIMEOUT_SECONDS,
+    TELNET_PORT,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,6 +52,10 @@ INIT_DATA_SCHEMA = vol.Schema(
     }
 )
 
+CONF_SUBNET = "subnet"
+
+HOSTNAME_LABEL_PATTERN = re.compile(r"(?!-)[A-Z\d-]{1,63}(?<!-)$", re.IGNORECASE)
+
 IDENTIFIERS_DATA_SCHEMA = vol.Schema(
     {vol.Required(CONF_UNIQUE_ID): str, vol.Required(CONF_NAME): str}
 )
@@ -49,8 +67,34 @@ def is_valid_hostname(hostname):
         return False
     if hostname[-1] == ".":
         hostname = hostname[:-1]  # strip exactly one dot from the right, if present
-    allowed = re.compile(r"(?!-)[A-Z\d-]{1,63}(?<!-)$", re.IGNORECASE)
-    return all(allowed.match(x) for x in hostname.split("."))
+    return all(HOSTNAME_LABEL_PATTERN.match(x) for x in hostname.split("."))
+
+
+async def async_probe_host(host: str, timeout_seconds: float) -> bool:
+    """Check whether a host accepts connections on the telnet port."""
+    try:
+        async with timeout(timeout_seconds):
+            _, writer = await asyncio.open_connection(host, TELNET_PORT)
+    except (OSError, asyncio.TimeoutError):
+        return False
+
+    writer.close()
+    with suppress(OSError):
+        await writer.wait_closed()
+    return True
+
+
+async def async_discover_hosts(subnet: ipaddress.IPv4Network) -> list[str]:
+    """Find the hosts in a subnet that accept connections on the telnet port."""
+    semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+
+    async def async_probe(host: str) -> bool:
+        async with semaphore:
+            return await async_probe_host(host, DISCOVERY_PROBE_TIMEOUT_SECONDS)
+
+    hosts = [str(host) for host in subnet.hosts()]
+    results = await asyncio.gather(*(async_probe(host) for host in hosts))
+    return [host for host, is_reachable in zip(hosts, results) if is_reachable]
 
 
 async def async_validate_connection(hass: HomeAssistant, data: dict):
@@ -61,6 +105,10 @@ async def async_validate_connection(hass: HomeAssistant, data: dict):
     if not is_valid_hostname(data[CONF_HOST]):
         raise InvalidHost
 
+    # Fail fast on unreachable hosts before attempting a full login
+    if not await async_probe_host(data[CONF_HOST], REACHABILITY_PROBE_TIMEOUT_SECONDS):
+        raise CannotConnect
+
     async def no_op(optional=None):
         pass
 
@@ -95,39 +143,98 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._host = None
         self._username = None
         self._password = None
+        self._discovered_hosts: list[str] = []
 
     async def async_step_user(self, user_input=None):
         """Start the user config flow."""
-        return await self.async_step_init()
+        return self.async_show_menu(step_id="user", menu_options=["discover", "init"])
 
     async def async_step_init(self, user_input=None):
         """Handle the initial step."""
         errors = {}
         if user_input is not None:
-            try:
-                await async_validate_connection(self.hass, user_input)
-                self._host = user_input[CONF_HOST]
-                self._username = user_input[CONF_USERNAME]
-                self._password = user_input[CONF_PASSWORD]
+            errors = await self._async_validate_connection(user_input)
+            if len(errors) == 0:
                 return await self.async_step_identifiers()
-            except CannotConnect:
-                errors[CONF_HOST] = "cannot_connect"
-            except InvalidHost:
-                errors[CONF_HOST] = "invalid_host"
-            except ReaderClosedException as exc:
-                if type(exc.cause) is InvalidUserException:
-                    errors[CONF_HOST] = "invalid_username"
-                if type(exc.cause) is InvalidPasswordException:
-                    errors[CONF_HOST] = "invalid_password"
-            except:
-                _LOGGER.exception("Unexpected exception")
-                errors["base"] = "unknown"
-                raise
 
         return self.async_show_form(
             step_id="init", data_schema=INIT_DATA_SCHEMA, errors=errors
         )
 
+    async def async_step_discover(self, user_input=None):
+        """Handle the subnet discovery step."""
+        errors = {}
+        if user_input is not None:
+            try:
+                subnet = ipaddress.IPv4Network(user_input[CONF_SUBNET], strict=False)
+            except ValueError:
+                errors[CONF_SUBNET] = "invalid_subnet"
+            else:
+                if subnet.num_addresses > DISCOVERY_MAX_HOSTS:
+                    errors[CONF_SUBNET] = "subnet_too_large"
+                else:
+                    self._discovered_hosts = await async_discover_hosts(subnet)
+                    if len(self._discovered_hosts) > 0:
+                        return await self.async_step_discovered()
+                    errors[CONF_SUBNET] = "no_devices_found"
+
+        # Without a usable source address the user just types the subnet in
+        default_subnet = ""
+        with suppress(exceptions.HomeAssistantError, ValueError):
+            source_ip = await network.async_get_source_ip(self.hass)
+            default_subnet = str(ipaddress.IPv4Network(f"{source_ip}/24", strict=False))
+
+        return self.async_show_form(
+            step_id="discover",
+            data_schema=vol.Schema(
+                {vol.Required(CONF_SUBNET, default=default_subnet): str}
+            ),
+            errors=errors,
+        )
+
+    async def async_step_discovered(self, user_input=None):
+        """Handle choosing one of the discovered hosts."""
+        errors = {}
+        if user_input is not None:
+            errors = await self._async_validate_connection(user_input)
+            if len(errors) == 0:
+                return await self.async_step_identifiers()
+
+        return self.async_show_form(
+            step_id="discovered",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_HOST): vol.In(self._discovered_hosts),
+                    vol.Required(CONF_USERNAME): str,
+                    vol.Required(CONF_PASSWORD): str,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def _async_validate_connection(self, user_input) -> dict[str, str]:
+        """Validate the connection details and keep them if they work."""
+        errors = {}
+        try:
+            await async_validate_connection(self.hass, user_input)
+            self._host = user_input[CONF_HOST]
+            self._username = user_input[CONF_USERNAME]
+            self._password = user_input[CONF_PASSWORD]
+        except CannotConnect:
+            errors[CONF_HOST] = "cannot_connect"
+        except InvalidHost:
+            errors[CONF_HOST] = "invalid_host"
+        except ReaderClosedException as exc:
+            if type(exc.cause) is InvalidUserException:
+                errors[CONF_HOST] = "invalid_username"
+            if type(exc.cause) is InvalidPasswordException:
+                errors[CONF_HOST] = "invalid_password"
+        except:
+            _LOGGER.exception("Unexpected exception")
+            errors["base"] = "unknown"
+            raise
+        return errors
+
     async def async_step_identifiers(self, user_input=None):
         """Handle the identifiers step."""
         errors = {}
@@ -166,6 +273,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
         self.config_entry = config_entry
+        self._options: dict[str, any] = {}
 
     async def async_step_init(
         self, user_input: dict[str, any] | None = None
@@ -179,6 +287,11 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         if existing_group_ids is None:
             existing_group_ids = []
 
+        existing_dual_session = self.config_entry.options.get("dual_session", False)
+        existing_max_update_interval = self.config_entry.options.get(
+            "max_update_interval", DEFAULT_MAX_UPDATE_INTERVAL_SECONDS
+        )
+
         errors = {}
         if user_input is not None:
             edited_target_ids = user_input.get("existing_target_ids")
@@ -217,7 +330,14 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 saved_options = {}
                 saved_options["target_ids"] = new_target_ids
                 saved_options["group_ids"] = new_group_ids
-                return self.async_create_entry(title="", data=saved_options)
+                saved_options["dual_session"] = user_input.get(
+                    "dual_session", existing_dual_session
+                )
+                saved_options["max_update_interval"] = user_input.get(
+                    "max_update_interval", existing_max_update_interval
+                )
+                self._options = saved_options
+                return await self.async_step_group_members()
 
         return self.async_show_form(
             step_id="init",
@@ -231,11 +351,59 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     ): cv.multi_select(existing_group_ids),
                     vol.Optional("target_id"): cv.string,
                     vol.Optional("group_id"): cv.string,
+                    vol.Optional(
+                        "dual_session", default=existing_dual_session
+                    ): cv.boolean,
+                    vol.Optional(
+                        "max_update_interval", default=existing_max_update_interval
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(
+                            min=BASE_UPDATE_INTERVAL_SECONDS,
+                            max=MAX_UPDATE_INTERVAL_LIMIT_SECONDS,
+                        ),
+                    ),
                 }
             ),
             errors=errors,
         )
 
+    async def async_step_group_members(
+        self, user_input: dict[str, any] | None = None
+    ) -> FlowResult:
+        """Manage which targets belong to each group."""
+        target_ids = self._options["target_ids"]
+        group_ids = self._options["group_ids"]
+
+        existing_group_members = self.config_entry.options.get("group_members")
+        if existing_group_members is None:
+            existing_group_members = {}
+
+        if user_input is not None or len(target_ids) == 0 or len(group_ids) == 0:
+            if user_input is None:
+                user_input = {}
+            self._options["group_members"] = {
+                group_id: sorted(user_input.get(group_id, [])) for group_id in group_ids
+            }
+            return self.async_create_entry(title="", data=self._options)
+
+        return self.async_show_form(
+            step_id="group_members",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        group_id,
+                        default=[
+                            target_id
+                            for target_id in existing_group_members.get(group_id, [])
+                            if target_id in target_ids
+                        ],
+                    ): cv.multi_select(target_ids)
+                    for group_id in group_ids
+                }
+            ),
+        )
+
 
 class CannotConnect(exceptions.HomeAssistantError):
     """Error to indicate we cannot connect."""
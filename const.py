@@ -5,3 +5,32 @@ from typing import Final
 
 DOMAIN: Final = "somfy_uai_plus"
 PLATFORMS: Final = [Platform.BINARY_SENSOR, Platform.COVER]
+
+# Seconds between refreshes: while commands or state changes have been seen
+# within the activity window, by default, and the default upper bound that the
+# interval stretches to during quiet periods
+ACTIVE_UPDATE_INTERVAL_SECONDS: Final = 10
+BASE_UPDATE_INTERVAL_SECONDS: Final = 60
+DEFAULT_MAX_UPDATE_INTERVAL_SECONDS: Final = 300
+MAX_UPDATE_INTERVAL_LIMIT_SECONDS: Final = 3600
+ACTIVITY_WINDOW_SECONDS: Final = 60
+
+# Seconds to wait between connection attempts
+RECONNECT_DELAY_SECONDS: Final = 2
+
+# Seconds a queued command may wait for the connection before it is dropped
+COMMAND_TIMEOUT_SECONDS: Final = 10
+
+# Seconds that reads from the UAI+ are reused for
+INFO_CACHE_TTL_SECONDS: Final = 3600
+POSITION_CACHE_TTL_SECONDS: Final = 5
+
+# Number of recent events kept for diagnostics
+EVENT_LOG_SIZE: Final = 200
+
+# Telnet port of the UAI+, probed when discovering and validating hosts
+TELNET_PORT: Final = 23
+REACHABILITY_PROBE_TIMEOUT_SECONDS: Final = 2
+DISCOVERY_PROBE_TIMEOUT_SECONDS: Final = 0.5
+DISCOVERY_CONCURRENCY: Final = 128
+DISCOVERY_MAX_HOSTS: Final = 1024
@@ -2,19 +2,20 @@
 
 from __future__ import annotations
 import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
 from datetime import timedelta
+from functools import partial
+from typing import TYPE_CHECKING, Any
 import logging
-import voluptuous as vol
+import time
 
-from homeassistant.components.cover import (
-    PLATFORM_SCHEMA,
-)
-
-from homeassistant.const import CONF_HOST, CONF_USERNAME, CONF_PASSWORD, CONF_NAME
-from homeassistant.core import HomeAssistant
-import homeassistant.helpers.config_validation as cv
+from homeassistant.core import callback, HomeAssistant
+from homeassistant.util import dt as dt_util
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
+    UpdateFailed,
 )
 
 from somfy_uai_plus_telnet.telnet_client import (
@@ -25,17 +26,35 @@ from somfy_uai_plus_telnet.telnet_client import (
     TelnetClient,
 )
 
+from .command_queue import SomfyUaiPlusCommandQueue
+from .const import (
+    ACTIVE_UPDATE_INTERVAL_SECONDS,
+    ACTIVITY_WINDOW_SECONDS,
+    BASE_UPDATE_INTERVAL_SECONDS,
+    COMMAND_TIMEOUT_SECONDS,
+    DEFAULT_MAX_UPDATE_INTERVAL_SECONDS,
+    EVENT_LOG_SIZE,
+    INFO_CACHE_TTL_SECONDS,
+    POSITION_CACHE_TTL_SECONDS,
+    RECONNECT_DELAY_SECONDS,
+)
+from .read_cache import SomfyUaiPlusReadCache
+
+if TYPE_CHECKING:
+    from .profiling import ProfileTimings
+
 _LOGGER = logging.getLogger("somfy_uai_plus")
 
-# Validation of user configuration
-PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
-    {
-        vol.Optional(CONF_NAME): cv.string,
-        vol.Required(CONF_HOST): cv.string,
-        vol.Required(CONF_USERNAME): cv.string,
-        vol.Required(CONF_PASSWORD): cv.string,
-    }
-)
+
+def _describe_exception(err: BaseException | None) -> dict[str, Any] | None:
+    """Describe an exception for diagnostics without its message.
+
+    Messages of connection errors include the UAI+'s address, which
+    diagnostics redact.
+    """
+    if err is None:
+        return None
+    return {"type": type(err).__name__, "errno": getattr(err, "errno", None)}
 
 
 class SomfyUaiPlusCoordinator(DataUpdateCoordinator):
@@ -49,6 +68,9 @@ class SomfyUaiPlusCoordinator(DataUpdateCoordinator):
         password: str,
         target_ids: list(str),
         group_ids: list(str),
+        dual_session: bool = False,
+        group_members: dict[str, list[str]] | None = None,
+        max_update_interval: int = DEFAULT_MAX_UPDATE_INTERVAL_SECONDS,
     ) -> None:
         """Initialize coordinator."""
         super().__init__(
@@ -56,13 +78,21 @@ class SomfyUaiPlusCoordinator(DataUpdateCoordinator):
             _LOGGER,
             # Name of the data. For logging purposes.
             name="Somfy UAI+",
-            update_interval=timedelta(seconds=60),
+            update_interval=timedelta(seconds=BASE_UPDATE_INTERVAL_SECONDS),
         )
         self._host: str = host
         self._username: str = username
         self._password: str = password
         self._target_ids: list(str) = target_ids
         self._group_ids: list(str) = group_ids
+        self._group_members: dict[str, list[str]] = {
+            group_id: [
+                target_id
+                for target_id in (group_members or {}).get(group_id, [])
+                if target_id in target_ids
+            ]
+            for group_id in group_ids
+        }
         self._telnet_client: TelnetClient = TelnetClient(
             self._host,
             self._username,
@@ -73,6 +103,41 @@ class SomfyUaiPlusCoordinator(DataUpdateCoordinator):
         self._is_connection_ready: bool = False
         self._should_reconnect: bool = False
         self._connection_task: asyncio.Task = None
+        self._disconnected_event: asyncio.Event = asyncio.Event()
+        self._command_queue: SomfyUaiPlusCommandQueue = SomfyUaiPlusCommandQueue(
+            self.async_wait_for_connection_ready
+        )
+        self._read_cache: SomfyUaiPlusReadCache = SomfyUaiPlusReadCache()
+        self._max_update_interval: timedelta = timedelta(seconds=max_update_interval)
+        self._last_activity_time: float = float("-inf")
+        self._activity_refresh_task: asyncio.Task = None
+
+        # Recent connection, command and refresh events, for diagnostics
+        self._events: deque[dict[str, Any]] = deque(maxlen=EVENT_LOG_SIZE)
+        self._created_time: float = time.perf_counter()
+        self._has_reported_entities_available: bool = False
+
+        # Set only while the profile service is running
+        self.profile_timings: ProfileTimings = None
+
+        # Optional second session dedicated to polling, so that slow reads do
+        # not hold up commands; unused if the UAI+ refuses a second login
+        self._polling_telnet_client: TelnetClient = None
+        self._is_polling_connection_ready: bool = False
+        self._use_polling_session: bool = dual_session
+        self._polling_connection_task: asyncio.Task = None
+        self._polling_disconnected_event: asyncio.Event = asyncio.Event()
+        self._polling_disconnect_cause: Exception = None
+        self._has_polling_connection_been_ready: bool = False
+        self._is_first_polling_attempt: bool = False
+        if dual_session:
+            self._polling_telnet_client = TelnetClient(
+                self._host,
+                self._username,
+                self._password,
+                async_on_connection_ready=self._async_on_polling_connection_ready,
+                async_on_disconnected=self._async_on_polling_disconnected,
+            )
 
         self.device_unique_id: str = self.config_entry.unique_id
         self.device_name: str = self.config_entry.title
@@ -85,6 +150,75 @@ class SomfyUaiPlusCoordinator(DataUpdateCoordinator):
         """Gets a value indicating whether the underlying connection is established."""
         return self._is_connection_ready
 
+    @property
+    def command_queue_stats(self) -> dict[str, int]:
+        """Gets counts of sent, failed and dropped commands."""
+        return self._command_queue.stats
+
+    @property
+    def read_cache_stats(self) -> dict[str, int]:
+        """Gets counts of read cache hits, shared reads and misses."""
+        return self._read_cache.stats
+
+    @property
+    def is_polling_session_active(self) -> bool:
+        """Gets a value indicating whether polling uses its own session."""
+        return self._use_polling_session and self._is_polling_connection_ready
+
+    @property
+    def _reader_telnet_client(self) -> TelnetClient:
+        if self.is_polling_session_active:
+            return self._polling_telnet_client
+        return self._telnet_client
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Gets a snapshot of coordinator state and recent events."""
+        return {
+            "is_connection_ready": self._is_connection_ready,
+            "is_polling_session_active": self.is_polling_session_active,
+            "last_update_success": self.last_update_success,
+            "update_interval_seconds": (
+                self.update_interval.total_seconds()
+                if self.update_interval is not None
+                else None
+            ),
+            "target_ids": self._target_ids,
+            "group_members": self._group_members,
+            "pending_commands": self._command_queue.pending_count,
+            "command_queue_stats": self.command_queue_stats,
+            "read_cache_stats": self.read_cache_stats,
+            "device_states": self.data["device_states"],
+            "events": list(self._events),
+        }
+
+    def _record_event(self, event: str, **details: Any) -> dict[str, Any]:
+        recorded_event = {
+            "time": dt_util.utcnow().isoformat(),
+            "event": event,
+            **details,
+        }
+        self._events.append(recorded_event)
+        return recorded_event
+
+    def _record_repeated_event(
+        self, previous_event: dict[str, Any] | None, event: str, **details: Any
+    ) -> dict[str, Any]:
+        """Record an event, or fold it into previous_event if it repeats that one.
+
+        Keeps a long outage's failed attempts from pushing what led up to it
+        out of the event log.
+        """
+        if previous_event is None:
+            recorded_event = self._record_event(event, count=1, **details)
+            recorded_event["last_time"] = recorded_event["time"]
+            return recorded_event
+        previous_event.update(
+            details,
+            count=previous_event["count"] + 1,
+            last_time=dt_util.utcnow().isoformat(),
+        )
+        return previous_event
+
     async def async_wait_for_connection_ready(self) -> None:
         """Waits for connection establishment."""
         await self._telnet_client.async_wait_for_connection_establishment()
@@ -92,31 +226,221 @@ class SomfyUaiPlusCoordinator(DataUpdateCoordinator):
     def connect_and_stay_connected(self) -> None:
         """Connect to the ISP; if the connection is dropped, reconnect indefinitely."""
         self._should_reconnect = True
-        self._connection_task = asyncio.create_task(self._async_connect())
+        # A single long-lived task owns the connection, so repeated calls and
+        # disconnects never leave more than one connection attempt running
+        if self._connection_task is None or self._connection_task.done():
+            self._connection_task = asyncio.create_task(self._async_stay_connected())
 
-    async def _async_connect(self):
-        while True:
+    async def _async_stay_connected(self) -> None:
+        failure_event: dict[str, Any] = None
+        while self._should_reconnect:
+            # Cleared before connecting so that a disconnect during login is seen
+            self._disconnected_event.clear()
             try:
                 await self._telnet_client.async_connect()
-                # await self._async_on_data_update()
-                break
-            except ConnectionError:
-                if not self._should_reconnect:
-                    break
-                await asyncio.sleep(2)
+            except Exception as err:  # pylint: disable=broad-except
+                # Anything escaping here would end the task and with it all
+                # reconnection, so every failure is logged and retried
+                _LOGGER.log(
+                    logging.WARNING if failure_event is None else logging.DEBUG,
+                    f"Connecting to UAI+ at {self._host} failed ({err!r}); retrying.",
+                )
+                failure_event = self._record_repeated_event(
+                    failure_event,
+                    "connect_failed",
+                    session="command",
+                    error=_describe_exception(err),
+                )
+            else:
+                failure_event = None
+                await self._disconnected_event.wait()
+            if self._should_reconnect:
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
 
     async def _async_on_connection_ready(self) -> None:
         self._is_connection_ready = True
+        self._record_event("connected", session="command")
+        self._note_activity()
+        self._is_first_polling_attempt = not self._is_polling_connection_ready
+        self._connect_polling_session()
 
     async def _async_on_disconnected(
         self, reader_closed_exception: ReaderClosedException
     ) -> None:
         self._is_connection_ready = False
-        if self._should_reconnect:
-            self.connect_and_stay_connected()
+        self._record_event(
+            "disconnected",
+            session="command",
+            cause=_describe_exception(reader_closed_exception.cause),
+        )
+        self._read_cache.clear()
+        self._disconnected_event.set()
+        # Nothing to poll until reconnected
+        self.update_interval = None
+        self.async_update_listeners()
+
+    def _connect_polling_session(self) -> None:
+        if not self._use_polling_session:
+            return
+        if (
+            self._polling_connection_task is None
+            or self._polling_connection_task.done()
+        ):
+            self._polling_connection_task = asyncio.create_task(
+                self._async_stay_polling_connected()
+            )
+
+    async def _async_stay_polling_connected(self) -> None:
+        # Runs only while the command session is up; restarted when it logs in again
+        failure_event: dict[str, Any] = None
+        while (
+            self._should_reconnect
+            and self._use_polling_session
+            and self._is_connection_ready
+        ):
+            # Failing straight after a fresh command-session login is taken to
+            # mean the UAI+ won't accept a second session; later failures (e.g.
+            # the UAI+ rebooting) are just retried
+            is_first_attempt = self._is_first_polling_attempt
+            self._is_first_polling_attempt = False
+            self._polling_disconnected_event.clear()
+            self._has_polling_connection_been_ready = False
+            failure: Exception = None
+            try:
+                await self._polling_telnet_client.async_connect()
+            except Exception as err:  # pylint: disable=broad-except
+                failure = err
+            else:
+                await self._polling_disconnected_event.wait()
+                if not self._has_polling_connection_been_ready:
+                    failure = self._polling_disconnect_cause
+
+            if failure is not None:
+                if is_first_attempt and self._is_connection_ready:
+                    self._fall_back_to_shared_session(failure)
+                    return
+                failure_event = self._record_repeated_event(
+                    failure_event,
+                    "connect_failed",
+                    session="polling",
+                    error=_describe_exception(failure),
+                )
+            else:
+                failure_event = None
+            if self._should_reconnect:
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+    async def _async_on_polling_connection_ready(self) -> None:
+        self._is_polling_connection_ready = True
+        self._has_polling_connection_been_ready = True
+        self._record_event("connected", session="polling")
+
+    async def _async_on_polling_disconnected(
+        self, reader_closed_exception: ReaderClosedException
+    ) -> None:
+        self._is_polling_connection_ready = False
+        self._record_event(
+            "disconnected",
+            session="polling",
+            cause=_describe_exception(reader_closed_exception.cause),
+        )
+        self._polling_disconnect_cause = reader_closed_exception
+        self._polling_disconnected_event.set()
+
+    def _fall_back_to_shared_session(self, cause: Exception) -> None:
+        _LOGGER.warning(
+            f"UAI+ at {self._host} refused a separate polling session ({cause}); polling over the command session instead."
+        )
+        self._use_polling_session = False
+        self._record_event("polling_session_refused", cause=_describe_exception(cause))
+
+    async def _async_timed(self, section: str, awaitable: Awaitable[Any]) -> Any:
+        start = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            if self.profile_timings is not None:
+                self.profile_timings.record(section, time.perf_counter() - start)
 
     async def _async_update_data(self):
         """Update the data from the UAI+"""
+        start = time.perf_counter()
+        try:
+            data = await self._async_timed("update data", self._async_fetch_data())
+        except Exception as err:
+            self._record_event(
+                "refresh_failed",
+                duration=round(time.perf_counter() - start, 4),
+                error=_describe_exception(err),
+            )
+            if isinstance(err, (ReaderClosedException, ConnectionError)):
+                # Expected when the UAI+ drops the connection or the entry
+                # unloads mid-refresh; reconnection is handled separately
+                raise UpdateFailed(f"Connection lost during update: {err!r}") from err
+            raise
+        self._record_event(
+            "refresh",
+            duration=round(time.perf_counter() - start, 4),
+            device_count=len(data["device_states"]),
+        )
+        if not self._has_reported_entities_available and data["device_states"]:
+            self._has_reported_entities_available = True
+            entities_available_duration = time.perf_counter() - self._created_time
+            _LOGGER.debug(
+                f"{self.device_name} entities available {entities_available_duration:.3f}s after setup."
+            )
+            self._record_event(
+                "entities_available", duration=round(entities_available_duration, 4)
+            )
+        self._adapt_update_interval(data["device_states"] != self.data["device_states"])
+        return data
+
+    def _adapt_update_interval(self, has_changed: bool) -> None:
+        """Poll quickly while things are happening and back off while quiet."""
+        if not self._is_connection_ready:
+            self.update_interval = None
+            return
+
+        now = time.monotonic()
+        if has_changed:
+            self._last_activity_time = now
+
+        if (
+            self._command_queue.pending_count > 0
+            or now - self._last_activity_time < ACTIVITY_WINDOW_SECONDS
+        ):
+            self.update_interval = timedelta(seconds=ACTIVE_UPDATE_INTERVAL_SECONDS)
+        elif self.update_interval is None:
+            self.update_interval = timedelta(seconds=BASE_UPDATE_INTERVAL_SECONDS)
+        else:
+            # Leaving the active interval goes straight back to the base one
+            self.update_interval = min(
+                max(
+                    self.update_interval * 2,
+                    timedelta(seconds=BASE_UPDATE_INTERVAL_SECONDS),
+                ),
+                self._max_update_interval,
+            )
+
+    @callback
+    def _note_activity(self) -> None:
+        """Switch to the active refresh interval, refreshing soon if not already."""
+        self._last_activity_time = time.monotonic()
+        if not self._should_reconnect:
+            return
+        active_update_interval = timedelta(seconds=ACTIVE_UPDATE_INTERVAL_SECONDS)
+        if self.update_interval != active_update_interval:
+            # A refresh reschedules the next one using the new interval
+            self.update_interval = active_update_interval
+            if (
+                self._activity_refresh_task is None
+                or self._activity_refresh_task.done()
+            ):
+                self._activity_refresh_task = self.hass.async_create_task(
+                    self.async_request_refresh()
+                )
+
+    async def _async_fetch_data(self):
         device_states = {}
         if self.is_connection_ready:
             previous_device_states = self.data["device_states"]
@@ -130,24 +454,35 @@ class SomfyUaiPlusCoordinator(DataUpdateCoordinator):
                     new_type = previous_device_state.get("type")
                 try:
                     if new_name is None or new_type is None:
-                        info: TargetInfo = (
-                            await self._telnet_client.async_get_target_info(target_id)
-                        )
+                        info: TargetInfo = await self.async_get_target_info(target_id)
                         new_name = info.name
                         new_type = info.type
 
-                    # closed_percentage: int = (
-                    #     await self._telnet_client.async_get_target_position(target_id)
-                    # )
+                    # Positions aren't polled, so keep the last known (assumed) one
+                    closed_percentage: int = None
+                    assumed_state: bool = False
+                    if previous_device_state is not None:
+                        closed_percentage = previous_device_state.get(
+                            "closed_percentage"
+                        )
+                        assumed_state = previous_device_state.get(
+                            "assumed_state", False
+                        )
                     device_states[target_id] = {
                         "name": new_name,
                         "type": new_type,
-                        # "closed_percentage": closed_percentage,
+                        "closed_percentage": closed_percentage,
+                        "assumed_state": assumed_state,
+                        "is_opening": False,
+                        "is_closing": False,
                     }
                 except ErrorResponseException as err:
                     _LOGGER.warning(
                         f"Request for target ID {target_id} failed with error: {err}."
                     )
+                    self._record_event(
+                        "error", target_id=target_id, error=_describe_exception(err)
+                    )
 
             for group_id in self._group_ids:
                 previous_device_state = previous_device_states.get(group_id)
@@ -156,9 +491,7 @@ class SomfyUaiPlusCoordinator(DataUpdateCoordinator):
                     new_name = previous_device_state.get("name")
                 try:
                     if new_name is None:
-                        info: GroupInfo = (
-                            await self._telnet_client.async_get_group_info(group_id)
-                        )
+                        info: GroupInfo = await self.async_get_group_info(group_id)
                         new_name = info.name
 
                     device_states[group_id] = {"name": new_name}
@@ -166,35 +499,226 @@ class SomfyUaiPlusCoordinator(DataUpdateCoordinator):
                     _LOGGER.warning(
                         f"Request for group ID {group_id} failed with error: {err}."
                     )
+                    self._record_event(
+                        "error", target_id=group_id, error=_describe_exception(err)
+                    )
+
+            self._aggregate_group_states(device_states)
 
         return {"device_states": device_states, "error": None}
 
+    def _aggregate_group_states(self, device_states: dict[str, Any]) -> None:
+        """Derive each group's state from the states of its member targets."""
+        for group_id, member_ids in self._group_members.items():
+            group_state = device_states.get(group_id)
+            if group_state is None or len(member_ids) == 0:
+                continue
+
+            member_states = [
+                device_states[member_id]
+                for member_id in member_ids
+                if member_id in device_states
+            ]
+            closed_percentages = [
+                member_state["closed_percentage"]
+                for member_state in member_states
+                if member_state.get("closed_percentage") is not None
+            ]
+
+            is_closed: bool = None
+            if any(percentage < 100 for percentage in closed_percentages):
+                is_closed = False
+            elif len(closed_percentages) == len(member_ids):
+                is_closed = True
+
+            group_state["members_available"] = len(member_states) > 0
+            # Averaging only the known positions would report a group with a
+            # stopped member as fully open or closed
+            group_state["closed_percentage"] = (
+                round(sum(closed_percentages) / len(closed_percentages))
+                if len(closed_percentages) == len(member_ids)
+                else None
+            )
+            group_state["is_closed"] = is_closed
+            group_state["is_opening"] = any(
+                member_state.get("is_opening") for member_state in member_states
+            )
+            group_state["is_closing"] = any(
+                member_state.get("is_closing") for member_state in member_states
+            )
+            group_state["assumed_state"] = any(
+                member_state.get("assumed_state") for member_state in member_states
+            )
+
+    @callback
+    def _apply_optimistic_state(
+        self,
+        target_id: str,
+        closed_percentage: int | None,
+        is_opening: bool = False,
+        is_closing: bool = False,
+    ) -> None:
+        """Assume the outcome of a command sent to a target or group.
+
+        A closed_percentage of None marks the position as unknown, e.g. after a
+        stop or a move to an intermediate position.
+        """
+        member_ids = [target_id]
+        if target_id in self._group_members:
+            member_ids = self._group_members[target_id]
+
+        device_states = self.data["device_states"]
+        for member_id in member_ids:
+            member_state = device_states.get(member_id)
+            if member_state is None:
+                continue
+            member_state["closed_percentage"] = closed_percentage
+            member_state["assumed_state"] = True
+            member_state["is_opening"] = is_opening
+            member_state["is_closing"] = is_closing
+
+        self._aggregate_group_states(device_states)
+        self.async_update_listeners()
+
     async def async_disconnect(self) -> None:
         """Disconnect from the ISP."""
         self._should_reconnect = False
-        if self._connection_task is not None:
-            await self._connection_task
+        await self._command_queue.async_stop()
+        for task in (
+            self._activity_refresh_task,
+            self._connection_task,
+            self._polling_connection_task,
+        ):
+            if task is not None and not task.done():
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+        self._activity_refresh_task = None
+        self._connection_task = None
+        self._polling_connection_task = None
+        # Also closes any connection left half open by a cancelled attempt
         await self._telnet_client.async_disconnect()
+        if self._polling_telnet_client is not None:
+            await self._polling_telnet_client.async_disconnect()
+
+    async def async_get_target_info(self, target_id: str) -> TargetInfo:
+        """Get a target's info, sharing any identical read already in flight."""
+        return await self._read_cache.async_get(
+            ("target_info", target_id),
+            lambda: self._async_timed(
+                "telnet get target info",
+                self._reader_telnet_client.async_get_target_info(target_id),
+            ),
+            INFO_CACHE_TTL_SECONDS,
+        )
+
+    async def async_get_group_info(self, group_id: str) -> GroupInfo:
+        """Get a group's info, sharing any identical read already in flight."""
+        return await self._read_cache.async_get(
+            ("group_info", group_id),
+            lambda: self._async_timed(
+                "telnet get group info",
+                self._reader_telnet_client.async_get_group_info(group_id),
+            ),
+            INFO_CACHE_TTL_SECONDS,
+        )
+
+    async def async_get_target_position(self, target_id: str) -> int:
+        """Get a target's closed percentage, sharing any identical read already in flight."""
+        return await self._read_cache.async_get(
+            ("target_position", target_id),
+            lambda: self._async_timed(
+                "telnet get target position",
+                self._reader_telnet_client.async_get_target_position(target_id),
+            ),
+            POSITION_CACHE_TTL_SECONDS,
+        )
+
+    async def _async_send_command(
+        self, target_id: str, name: str, async_send: Callable[[], Awaitable[None]]
+    ) -> bool:
+        self._note_activity()
+        start = time.perf_counter()
+        try:
+            was_sent = await self._async_timed(
+                "queue and send command",
+                self._command_queue.async_submit(
+                    target_id,
+                    name,
+                    lambda: self._async_timed("telnet send command", async_send()),
+                    COMMAND_TIMEOUT_SECONDS,
+                ),
+            )
+        except Exception as err:
+            self._record_event(
+                "command",
+                target_id=target_id,
+                command=name,
+                outcome="failed",
+                duration=round(time.perf_counter() - start, 4),
+                error=_describe_exception(err),
+            )
+            raise
+        self._record_event(
+            "command",
+            target_id=target_id,
+            command=name,
+            outcome="sent" if was_sent else "dropped",
+            duration=round(time.perf_counter() - start, 4),
+        )
+        self._read_cache.invalidate(("target_position", target_id))
+        for member_id in self._group_members.get(target_id, []):
+            self._read_cache.invalidate(("target_position", member_id))
+        return was_sent
 
     async def async_move_target_up(self, target_id: str) -> None:
-        await self._telnet_client.async_move_target_up(target_id)
+        if await self._async_send_command(
+            target_id,
+            "move up",
+            partial(self._telnet_client.async_move_target_up, target_id),
+        ):
+            self._apply_optimistic_state(target_id, 0, is_opening=True)
 
     async def async_move_target_down(self, target_id: str) -> None:
-        await self._telnet_client.async_move_target_down(target_id)
+        if await self._async_send_command(
+            target_id,
+            "move down",
+            partial(self._telnet_client.async_move_target_down, target_id),
+        ):
+            self._apply_optimistic_state(target_id, 100, is_closing=True)
 
     async def async_stop_target(self, target_id: str) -> None:
-        await self._telnet_client.async_stop_target(target_id)
+        if await self._async_send_command(
+            target_id,
+            "stop",
+            partial(self._telnet_client.async_stop_target, target_id),
+        ):
+            self._apply_optimistic_state(target_id, None)
 
     async def async_move_target_to_closed_percentage(
         self, target_id: str, closed_percentage: int
     ) -> None:
-        await self._telnet_client.async_move_target_to_position(
-            target_id, closed_percentage
-        )
+        if await self._async_send_command(
+            target_id,
+            f"move to {closed_percentage}% closed",
+            partial(
+                self._telnet_client.async_move_target_to_position,
+                target_id,
+                closed_percentage,
+            ),
+        ):
+            self._apply_optimistic_state(target_id, closed_percentage)
 
     async def async_move_target_to_intermediate_position(
         self, target_id: str, intermediate_position: int
     ) -> None:
-        await self._telnet_client.async_move_target_to_intermediate_position(
-            target_id, intermediate_position
-        )
+        if await self._async_send_command(
+            target_id,
+            f"move to intermediate position {intermediate_position}",
+            partial(
+                self._telnet_client.async_move_target_to_intermediate_position,
+                target_id,
+                intermediate_position,
+            ),
+        ):
+            self._apply_optimistic_state(target_id, None)
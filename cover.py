@@ -229,18 +229,18 @@ class SomfyCover(CoordinatorEntity, CoverEntity):
             self._attr_name = name
             self._attr_device_class = device_class
 
-            # closed_percentage = device_state["closed_percentage"]
-            # position = 100 - closed_percentage
-            # last_position = self.current_cover_position
-
             self._attr_available = coordinator.is_connection_ready
-            # self._attr_current_cover_position = position
-            # self._attr_is_closed = position == 0
-            # self._attr_is_opening = False
-            # self._attr_is_closing = False
-            # if last_position is not None and 100 > position > 0:
-                # self._attr_is_opening = last_position < position
-                # self._attr_is_closing = last_position > position
+            self._attr_assumed_state = device_state["assumed_state"]
+            self._attr_is_opening = device_state["is_opening"]
+            self._attr_is_closing = device_state["is_closing"]
+
+            closed_percentage = device_state["closed_percentage"]
+            self._attr_current_cover_position = None
+            self._attr_is_closed = None
+            if closed_percentage is not None:
+                position = 100 - closed_percentage
+                self._attr_current_cover_position = position
+                self._attr_is_closed = position == 0
 
 
 class SomfyCoverGroup(CoordinatorEntity, CoverEntity):
@@ -250,7 +250,10 @@ class SomfyCoverGroup(CoordinatorEntity, CoverEntity):
         CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE | CoverEntityFeature.STOP
     )
 
+    _attr_current_cover_position: int | None = None
     _attr_is_closed: bool | None = None
+    _attr_is_closing: bool | None = None
+    _attr_is_opening: bool | None = None
 
     def __init__(self, coordinator: SomfyUaiPlusCoordinator, group_id: str) -> None:
         """Initialize."""
@@ -327,4 +330,17 @@ class SomfyCoverGroup(CoordinatorEntity, CoverEntity):
 
             self._attr_name = name
 
-            self._attr_available = coordinator.is_connection_ready
+            self._attr_available = coordinator.is_connection_ready and device_state.get(
+                "members_available", True
+            )
+
+            # Present only for groups whose member targets are configured
+            if "closed_percentage" in device_state:
+                closed_percentage = device_state["closed_percentage"]
+                self._attr_current_cover_position = (
+                    100 - closed_percentage if closed_percentage is not None else None
+                )
+                self._attr_is_closed = device_state["is_closed"]
+                self._attr_is_opening = device_state["is_opening"]
+                self._attr_is_closing = device_state["is_closing"]
+                self._attr_assumed_state = device_state["assumed_state"]
@@ -0,0 +1,85 @@
+"""Somfy UAI+ multi-hub cover dispatch"""
+
+from __future__ import annotations
+import asyncio
+from collections import defaultdict
+import logging
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN
+from .coordinator import SomfyUaiPlusCoordinator
+
+_LOGGER = logging.getLogger("somfy_uai_plus")
+
+COMMANDS = {
+    "open": SomfyUaiPlusCoordinator.async_move_target_up,
+    "close": SomfyUaiPlusCoordinator.async_move_target_down,
+    "stop": SomfyUaiPlusCoordinator.async_stop_target,
+}
+
+
+async def async_dispatch(hass: HomeAssistant, entity_ids: list[str], command: str):
+    """Send a command to covers spread over several UAI+ hubs.
+
+    The covers are split per hub and each hub's batch runs concurrently on its
+    own connection, so the call takes as long as the slowest hub.
+    """
+    entity_registry = er.async_get(hass)
+    target_ids_by_entry_id: defaultdict[str, list[str]] = defaultdict(list)
+    for entity_id in entity_ids:
+        entity_entry = entity_registry.async_get(entity_id)
+        if (
+            entity_entry is None
+            or entity_entry.platform != DOMAIN
+            or entity_entry.domain != Platform.COVER
+            or entity_entry.config_entry_id not in hass.data[DOMAIN]
+        ):
+            raise HomeAssistantError(f"{entity_id} is not a loaded Somfy UAI+ cover")
+        target_ids_by_entry_id[entity_entry.config_entry_id].append(
+            entity_entry.unique_id
+        )
+
+    coordinators: list[SomfyUaiPlusCoordinator] = [
+        hass.data[DOMAIN][entry_id]["coordinator"]
+        for entry_id in target_ids_by_entry_id
+    ]
+    results = await asyncio.gather(
+        *(
+            _async_run_batch(coordinator, target_ids, command)
+            for coordinator, target_ids in zip(
+                coordinators, target_ids_by_entry_id.values()
+            )
+        ),
+        return_exceptions=True,
+    )
+
+    failed_hubs = []
+    for coordinator, result in zip(coordinators, results):
+        if isinstance(result, Exception):
+            _LOGGER.warning(
+                f"Command {command} failed on {coordinator.device_name}: {result}."
+            )
+            failed_hubs.append(coordinator.device_name)
+    if len(failed_hubs) > 0:
+        raise HomeAssistantError(
+            f"Command {command} failed on {', '.join(failed_hubs)}"
+        )
+
+
+async def _async_run_batch(
+    coordinator: SomfyUaiPlusCoordinator, target_ids: list[str], command: str
+) -> None:
+    # The hub's command queue interleaves these fairly on its connection
+    send = COMMANDS[command]
+    results = await asyncio.gather(
+        *(send(coordinator, target_id) for target_id in target_ids),
+        return_exceptions=True,
+    )
+    # Raised only once every command has finished, so none is left running
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
@@ -0,0 +1,95 @@
+"""Somfy UAI+ coordinator profiling"""
+
+from __future__ import annotations
+import asyncio
+from collections import defaultdict
+import cProfile
+import io
+import logging
+import pstats
+import time
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger("somfy_uai_plus")
+
+_profile_lock = asyncio.Lock()
+
+
+class ProfileTimings:
+    """Wall-clock durations of awaited sections, collected while profiling.
+
+    cProfile only sees time spent running on the event loop, so time spent
+    waiting on the UAI+ is timed separately.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._durations: defaultdict[str, list[float]] = defaultdict(list)
+
+    def record(self, section: str, seconds: float) -> None:
+        """Record one duration for a section."""
+        self._durations[section].append(seconds)
+
+    def format_report(self) -> str:
+        """Format a summary of the recorded durations."""
+        lines = [
+            f"{'section':<40}{'count':>8}{'total s':>12}{'mean s':>12}{'max s':>12}"
+        ]
+        for section, durations in sorted(self._durations.items()):
+            lines.append(
+                f"{section:<40}{len(durations):>8}{sum(durations):>12.4f}"
+                f"{sum(durations) / len(durations):>12.4f}{max(durations):>12.4f}"
+            )
+        return "\n".join(lines)
+
+
+async def async_profile(hass: HomeAssistant, seconds: float) -> str:
+    """Profile the event loop for a number of seconds and write a report.
+
+    Returns the path of the report, which is written to the config directory.
+    """
+    if _profile_lock.locked():
+        raise HomeAssistantError("A Somfy UAI+ profile is already running")
+
+    async with _profile_lock:
+        coordinators = [data["coordinator"] for data in hass.data[DOMAIN].values()]
+        timings = ProfileTimings()
+        profiler = cProfile.Profile()
+
+        for coordinator in coordinators:
+            coordinator.profile_timings = timings
+        profiler.enable()
+        try:
+            # Make sure at least one update cycle falls within the profile; a
+            # requested refresh is debounced and may not run in time
+            for coordinator in coordinators:
+                await coordinator.async_refresh()
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.disable()
+            for coordinator in coordinators:
+                coordinator.profile_timings = None
+
+        path = hass.config.path(f"{DOMAIN}_profile.{int(time.time())}.txt")
+        await hass.async_add_executor_job(_write_report, path, profiler, timings)
+        _LOGGER.info(f"Somfy UAI+ profile written to {path}")
+        return path
+
+
+def _write_report(path: str, profiler: cProfile.Profile, timings: ProfileTimings):
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream).sort_stats(pstats.SortKey.CUMULATIVE)
+
+    stream.write("Awaited sections (wall clock)\n\n")
+    stream.write(timings.format_report())
+    stream.write("\n\nIntegration and telnet client functions\n")
+    stats.print_stats("somfy_uai_plus")
+    stream.write("\nAll functions\n")
+    stats.print_stats(50)
+
+    with open(path, "w", encoding="utf-8") as report_file:
+        report_file.write(stream.getvalue())
@@ -0,0 +1,76 @@
+"""Somfy UAI+ read cache"""
+
+from __future__ import annotations
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class SomfyUaiPlusReadCache:
+    """Read-through cache for UAI+ queries.
+
+    Values are kept for a per-entry TTL, and concurrent reads of the same key
+    share a single request to the UAI+ rather than each sending their own.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self._stats: dict[str, int] = {"hits": 0, "shared": 0, "misses": 0}
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Gets counts of cache hits, shared in-flight reads and misses."""
+        return dict(self._stats)
+
+    async def async_get(
+        self,
+        key: Hashable,
+        async_fetch: Callable[[], Awaitable[Any]],
+        ttl_seconds: float,
+    ) -> Any:
+        """Return the cached value for key, fetching it if missing or expired."""
+        loop = asyncio.get_running_loop()
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > loop.time():
+            self._stats["hits"] += 1
+            return entry[1]
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._stats["shared"] += 1
+        else:
+            self._stats["misses"] += 1
+            task = asyncio.create_task(async_fetch())
+            self._in_flight[key] = task
+            task.add_done_callback(
+                lambda done_task: self._on_fetch_done(key, done_task, ttl_seconds)
+            )
+
+        # Shielded so that one cancelled caller does not cancel the shared read
+        return await asyncio.shield(task)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Forget the cached value for key, including any read in flight."""
+        self._entries.pop(key, None)
+        self._in_flight.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget all cached values."""
+        self._entries.clear()
+        self._in_flight.clear()
+
+    def _on_fetch_done(
+        self, key: Hashable, task: asyncio.Task, ttl_seconds: float
+    ) -> None:
+        # A read invalidated while in flight may already be stale; don't keep it
+        if self._in_flight.get(key) is not task:
+            return
+        del self._in_flight[key]
+        if not task.cancelled() and task.exception() is None:
+            self._entries[key] = (
+                asyncio.get_running_loop().time() + ttl_seconds,
+                task.result(),
+            )
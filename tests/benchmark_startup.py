@@ -0,0 +1,128 @@
+"""Benchmark of the integration's startup against a fake UAI+
+
+Measures how long importing the integration takes on top of the Home Assistant
+modules already loaded by then, each run in a fresh interpreter, and how long
+after a coordinator is created its entities have data. Run with:
+
+    python tests/benchmark_startup.py [--runs N]
+"""
+
+import argparse
+import asyncio
+import pathlib
+import statistics
+import subprocess
+import sys
+import time
+
+from harness import (
+    FakeUaiPlus,
+    async_home_assistant,
+    create_coordinator,
+    load_integration,
+)
+
+TARGET_IDS = ["01020304", "01020305", "01020306"]
+GROUP_IDS = ["0A0B0C"]
+
+IMPORT_SCRIPT = """
+import sys
+import time
+
+sys.path.insert(0, {tests_dir!r})
+
+# Already imported by Home Assistant before it loads any integration
+import homeassistant.components.network
+import homeassistant.config_entries
+import homeassistant.helpers.update_coordinator
+
+from harness import PACKAGE_NAME, load_integration
+
+start = time.perf_counter()
+load_integration()
+integration_duration = time.perf_counter() - start
+
+start = time.perf_counter()
+for platform in ("config_flow", "cover", "binary_sensor", "diagnostics"):
+    __import__(f"{{PACKAGE_NAME}}.{{platform}}")
+platforms_duration = time.perf_counter() - start
+
+print(integration_duration, platforms_duration)
+"""
+
+
+def measure_imports(runs: int) -> dict[str, list[float]]:
+    """Time importing the integration and its platforms in fresh interpreters."""
+    script = IMPORT_SCRIPT.format(tests_dir=str(pathlib.Path(__file__).parent))
+    durations = {"import integration": [], "import platforms": []}
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            check=True,
+            stdout=subprocess.PIPE,
+            text=True,
+        ).stdout
+        integration_duration, platforms_duration = map(float, output.split())
+        durations["import integration"].append(integration_duration)
+        durations["import platforms"].append(platforms_duration)
+    return durations
+
+
+async def async_measure_entities_available(runs: int) -> dict[str, list[float]]:
+    """Time from creating a coordinator until every device has data."""
+    integration = load_integration()
+    fake_uai_plus = FakeUaiPlus(integration.const.TELNET_PORT)
+    await fake_uai_plus.async_start()
+    durations = {"entities available": []}
+    try:
+        async with async_home_assistant() as hass:
+            for _ in range(runs):
+                start = time.perf_counter()
+                coordinator = create_coordinator(hass, TARGET_IDS, GROUP_IDS)
+                available = asyncio.Event()
+
+                def on_update() -> None:
+                    device_states = coordinator.data["device_states"]
+                    if len(device_states) == len(TARGET_IDS) + len(GROUP_IDS):
+                        available.set()
+
+                # As the entities do once added
+                remove_listener = coordinator.async_add_listener(on_update)
+                coordinator.connect_and_stay_connected()
+                await asyncio.wait_for(available.wait(), 30)
+                durations["entities available"].append(time.perf_counter() - start)
+
+                remove_listener()
+                await coordinator.async_disconnect()
+                await coordinator.async_shutdown()
+    finally:
+        await fake_uai_plus.async_stop()
+    return durations
+
+
+def format_report(durations: dict[str, list[float]]) -> str:
+    """Format a summary of the measured durations."""
+    lines = [
+        f"{'measurement':<24}{'runs':>6}{'min s':>10}{'median s':>10}{'max s':>10}"
+    ]
+    for measurement, values in durations.items():
+        lines.append(
+            f"{measurement:<24}{len(values):>6}{min(values):>10.4f}"
+            f"{statistics.median(values):>10.4f}{max(values):>10.4f}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Run the benchmark and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="runs of each measurement")
+    args = parser.parse_args()
+
+    durations = measure_imports(args.runs)
+    durations.update(asyncio.run(async_measure_entities_available(args.runs)))
+    print(format_report(durations))
+
+
+if __name__ == "__main__":
+    main()
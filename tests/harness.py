@@ -0,0 +1,284 @@
+"""Fake UAI+ and Home Assistant harness for the soak tests and benchmarks"""
+
+from __future__ import annotations
+import asyncio
+from async_timeout import timeout
+import atexit
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+import importlib
+import json
+import pathlib
+import shutil
+import sys
+import tempfile
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+PACKAGE_DIR = pathlib.Path(__file__).resolve().parent.parent
+DOMAIN = "somfy_uai_plus"
+PACKAGE_NAME = f"custom_components.{DOMAIN}"
+
+HOST = "127.0.0.1"
+USERNAME = "user"
+PASSWORD = "password"
+
+_custom_components_root: pathlib.Path = None
+
+
+def load_integration() -> ModuleType:
+    """Import this checkout as custom_components.somfy_uai_plus.
+
+    The integration lives in the repository root rather than under
+    custom_components, so it is linked into a temporary custom_components
+    directory, where Home Assistant's loader finds it like any other custom
+    integration.
+    """
+    global _custom_components_root  # pylint: disable=global-statement
+    if _custom_components_root is None:
+        _custom_components_root = pathlib.Path(tempfile.mkdtemp(prefix=f"{DOMAIN}_"))
+        atexit.register(shutil.rmtree, _custom_components_root, ignore_errors=True)
+        (_custom_components_root / "custom_components").mkdir()
+        (_custom_components_root / "custom_components" / DOMAIN).symlink_to(
+            PACKAGE_DIR, target_is_directory=True
+        )
+        sys.path.insert(0, str(_custom_components_root))
+        importlib.invalidate_caches()
+    return importlib.import_module(PACKAGE_NAME)
+
+
+class FakeUaiPlus:
+    """Stand-in for a UAI+'s telnet interface, listening on the loopback address.
+
+    Any client presenting the expected credentials at the User: and Password:
+    prompts is logged in, and every JSON RPC request is answered with a
+    plausible result. Connections can be dropped on demand to make the
+    integration reconnect.
+
+    It listens on an ephemeral port, and connections made on the running loop
+    to the telnet port on the loopback address are redirected to it, so no
+    privileged port is needed.
+    """
+
+    def __init__(self, telnet_port: int) -> None:
+        """Initialize."""
+        self._telnet_port: int = telnet_port
+        self._server: asyncio.Server = None
+        self._loop: asyncio.AbstractEventLoop = None
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._session_writers: set[asyncio.StreamWriter] = set()
+        self._changed: asyncio.Event = asyncio.Event()
+        self.port: int = 0
+        self.accepted_count: int = 0
+        self.login_count: int = 0
+        self.request_count: int = 0
+
+    @property
+    def open_connection_count(self) -> int:
+        """Gets the number of connections currently open, logged in or not."""
+        return len(self._writers)
+
+    @property
+    def session_count(self) -> int:
+        """Gets the number of logged in connections currently open."""
+        return len(self._session_writers)
+
+    async def async_start(self) -> None:
+        """Start listening, on the same port as before if restarted."""
+        self._server = await asyncio.start_server(
+            self._async_handle_client, HOST, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        if self._loop is None:
+            self._redirect_connections()
+
+    async def async_stop_listening(self) -> None:
+        """Drop all connections and refuse new ones, as a UAI+ that is down would."""
+        self.drop_connections()
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def async_stop(self) -> None:
+        """Stop listening and stop redirecting connections."""
+        await self.async_stop_listening()
+        if self._loop is not None:
+            del self._loop.create_connection
+            self._loop = None
+
+    def drop_connections(self) -> None:
+        """Close every open connection, as a UAI+ reboot would."""
+        for writer in list(self._writers):
+            writer.close()
+
+    async def async_wait_until(
+        self, predicate: Callable[[], bool], timeout_seconds: float = 10
+    ) -> bool:
+        """Wait for the connection counts to satisfy predicate.
+
+        Returns False if they don't within the timeout.
+        """
+        try:
+            async with timeout(timeout_seconds):
+                while not predicate():
+                    self._changed.clear()
+                    await self._changed.wait()
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def _redirect_connections(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        create_connection = self._loop.create_connection
+
+        async def async_create_connection(
+            protocol_factory, host=None, port=None, *args, **kwargs
+        ):
+            if host == HOST and port == self._telnet_port:
+                port = self.port
+            return await create_connection(
+                protocol_factory, host, port, *args, **kwargs
+            )
+
+        # Shadows the loop's method until async_stop deletes it again
+        self._loop.create_connection = async_create_connection
+
+    async def _async_handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._writers.add(writer)
+        self.accepted_count += 1
+        self._changed.set()
+        try:
+            if await self._async_log_in(reader, writer):
+                self._session_writers.add(writer)
+                self.login_count += 1
+                self._changed.set()
+                while line := await reader.readline():
+                    response = self._respond(line)
+                    if response is not None:
+                        writer.write(response)
+                        await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            self._session_writers.discard(writer)
+            writer.close()
+            self._changed.set()
+
+    @staticmethod
+    async def _async_log_in(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bool:
+        writer.write(b"User: ")
+        await writer.drain()
+        username = (await reader.readline()).strip()
+        writer.write(b"Password: ")
+        await writer.drain()
+        password = (await reader.readline()).strip()
+        if username != USERNAME.encode() or password != PASSWORD.encode():
+            writer.write(b"\r\nInvalid user or password\r\n")
+            await writer.drain()
+            return False
+        writer.write(b"\r\nConnected:\r\n")
+        await writer.drain()
+        return True
+
+    def _respond(self, line: bytes) -> bytes | None:
+        try:
+            request: dict[str, Any] = json.loads(line)
+        except ValueError:
+            return None
+        self.request_count += 1
+
+        method: str = request.get("method", "")
+        params: dict[str, Any] = request.get("params") or {}
+        device_id = params.get("targetID", params.get("groupID", ""))
+        result: dict[str, Any] = {}
+        if method.endswith(".info"):
+            result = {"name": f"Shade {device_id}", "type": "ST30"}
+        elif method.endswith(".position"):
+            result = {"position": 0}
+
+        response = {"jsonrpc": "2.0", "result": result, "id": request.get("id")}
+        return json.dumps(response).encode() + b"\r\n"
+
+
+@asynccontextmanager
+async def async_home_assistant() -> AsyncIterator[HomeAssistant]:
+    """Run a Home Assistant instance with a temporary config directory.
+
+    It is prepared as far as bootstrap goes before setting up integrations, so
+    config entries can be set up, reloaded and unloaded. The default
+    integrations, including the HTTP server, are not set up.
+    """
+    from homeassistant import auth, bootstrap, config_entries, loader
+    from homeassistant.core import HomeAssistant
+
+    load_integration()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hass.config.skip_pip = True
+        loader.async_setup(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        try:
+            await bootstrap.async_load_base_functionality(hass)
+            # The http integration, which network depends on, needs auth
+            hass.auth = await auth.auth_manager_from_config(hass, [], [])
+            yield hass
+        finally:
+            await hass.async_stop(force=True)
+
+
+def _create_config_entry(
+    target_ids: list[str], group_ids: list[str], options: dict[str, Any]
+) -> ConfigEntry:
+    from homeassistant import config_entries
+
+    return config_entries.ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title="Fake UAI+",
+        data={"host": HOST, "username": USERNAME, "password": PASSWORD},
+        source=config_entries.SOURCE_USER,
+        options={"target_ids": target_ids, "group_ids": group_ids, **options},
+        unique_id=HOST,
+    )
+
+
+async def async_add_config_entry(
+    hass: HomeAssistant,
+    target_ids: list[str],
+    group_ids: list[str],
+    **options: Any,
+) -> ConfigEntry:
+    """Add and set up a config entry for the fake UAI+."""
+    entry = _create_config_entry(target_ids, group_ids, options)
+    await hass.config_entries.async_add(entry)
+    return entry
+
+
+def create_coordinator(
+    hass: HomeAssistant,
+    target_ids: list[str],
+    group_ids: list[str],
+    **options: Any,
+):
+    """Create a coordinator for the fake UAI+ without setting up an entry."""
+    from homeassistant import config_entries
+
+    integration = load_integration()
+    token = config_entries.current_entry.set(
+        _create_config_entry(target_ids, group_ids, options)
+    )
+    try:
+        return integration.coordinator.SomfyUaiPlusCoordinator(
+            hass, HOST, USERNAME, PASSWORD, target_ids, group_ids, **options
+        )
+    finally:
+        config_entries.current_entry.reset(token)
@@ -0,0 +1,256 @@
+"""Soak tests of the integration's connection handling against a fake UAI+
+
+Run with SOAK_CYCLES set to soak for longer than the default.
+"""
+
+import asyncio
+import gc
+import os
+import tracemalloc
+
+import pytest
+
+pytest.importorskip("homeassistant")
+somfy_uai_plus_telnet = pytest.importorskip("somfy_uai_plus_telnet")
+
+from homeassistant.config_entries import ConfigEntryState  # noqa: E402
+from homeassistant.helpers import (  # noqa: E402
+    device_registry as dr,
+    entity_registry as er,
+)
+
+from harness import (  # noqa: E402
+    DOMAIN,
+    FakeUaiPlus,
+    async_add_config_entry,
+    async_home_assistant,
+    create_coordinator,
+    load_integration,
+)
+
+SOAK_CYCLES = int(os.environ.get("SOAK_CYCLES", "2000"))
+WARM_UP_CYCLES = min(100, SOAK_CYCLES // 10)
+
+TARGET_IDS = ["01020304", "01020305", "01020306"]
+GROUP_IDS = ["0A0B0C"]
+
+# Tasks and memory may differ a little from cycle to cycle, e.g. depending on
+# whether a refresh is in progress, but must not grow with the number of cycles
+MAX_TASK_GROWTH = 5
+MAX_MEMORY_GROWTH_BYTES = 512 * 1024
+
+
+@pytest.fixture
+def integration(monkeypatch: pytest.MonkeyPatch):
+    """The integration, reconnecting without delay."""
+    integration = load_integration()
+    monkeypatch.setattr(integration.coordinator, "RECONNECT_DELAY_SECONDS", 0)
+    return integration
+
+
+async def _async_wait_for(predicate, timeout_seconds: float = 10) -> bool:
+    """Wait for the coordinator to catch up with the fake UAI+."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_seconds
+    while not predicate():
+        if loop.time() > deadline:
+            return False
+        await asyncio.sleep(0.01)
+    return True
+
+
+async def _async_settle(hass) -> int:
+    """Wait for in-progress work and return the number of tasks left running."""
+    await hass.async_block_till_done()
+    gc.collect()
+    return len(asyncio.all_tasks())
+
+
+def _traced_memory(integration) -> int:
+    """Bytes still allocated by the integration's and the telnet client's code.
+
+    Other allocations, e.g. log records captured by pytest, are left out.
+    """
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        [
+            tracemalloc.Filter(True, os.path.join(integration.__path__[0], "*")),
+            tracemalloc.Filter(
+                True, os.path.join(somfy_uai_plus_telnet.__path__[0], "*")
+            ),
+        ]
+    )
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+@pytest.mark.parametrize("dual_session", [False, True])
+def test_reconnect_cycles(integration, dual_session: bool) -> None:
+    """Repeated drops by the UAI+ leave one session each and nothing behind."""
+    session_count = 2 if dual_session else 1
+
+    async def async_soak() -> None:
+        fake_uai_plus = FakeUaiPlus(integration.const.TELNET_PORT)
+        await fake_uai_plus.async_start()
+        async with async_home_assistant() as hass:
+            coordinator = create_coordinator(
+                hass, TARGET_IDS, GROUP_IDS, dual_session=dual_session
+            )
+            coordinator.connect_and_stay_connected()
+            assert await fake_uai_plus.async_wait_until(
+                lambda: fake_uai_plus.session_count == session_count
+            )
+
+            tracemalloc.start()
+            try:
+                for cycle in range(SOAK_CYCLES):
+                    if cycle == WARM_UP_CYCLES:
+                        baseline_tasks = await _async_settle(hass)
+                        baseline_memory = _traced_memory(integration)
+
+                    login_count = fake_uai_plus.login_count
+                    fake_uai_plus.drop_connections()
+                    assert await fake_uai_plus.async_wait_until(
+                        lambda: fake_uai_plus.login_count >= login_count + session_count
+                    ), f"not reconnected after cycle {cycle}"
+                    # Nothing else still connected, e.g. a second command session
+                    assert await fake_uai_plus.async_wait_until(
+                        lambda: fake_uai_plus.open_connection_count == session_count
+                    ), (
+                        f"{fake_uai_plus.open_connection_count} connections open "
+                        f"after cycle {cycle}"
+                    )
+
+                tasks = await _async_settle(hass)
+                memory = _traced_memory(integration)
+            finally:
+                tracemalloc.stop()
+
+            assert await _async_wait_for(
+                lambda: coordinator.is_connection_ready
+                and coordinator.is_polling_session_active == dual_session
+            )
+            assert tasks - baseline_tasks <= MAX_TASK_GROWTH
+            assert memory - baseline_memory <= MAX_MEMORY_GROWTH_BYTES
+
+            await coordinator.async_disconnect()
+            await coordinator.async_shutdown()
+            assert await fake_uai_plus.async_wait_until(
+                lambda: fake_uai_plus.open_connection_count == 0
+            )
+        await fake_uai_plus.async_stop()
+
+    asyncio.run(async_soak())
+
+
+def test_reconnect_while_unreachable(integration) -> None:
+    """Connection attempts that fail keep being retried, one at a time."""
+
+    async def async_soak() -> None:
+        fake_uai_plus = FakeUaiPlus(integration.const.TELNET_PORT)
+        await fake_uai_plus.async_start()
+        await fake_uai_plus.async_stop_listening()
+        async with async_home_assistant() as hass:
+            coordinator = create_coordinator(hass, TARGET_IDS, GROUP_IDS)
+            # Nothing is listening, so every attempt is refused
+            coordinator.connect_and_stay_connected()
+            baseline_tasks = await _async_settle(hass)
+            for _ in range(SOAK_CYCLES // 10):
+                await asyncio.sleep(0.001)
+                assert not coordinator._connection_task.done()
+            assert await _async_settle(hass) - baseline_tasks <= MAX_TASK_GROWTH
+
+            # The whole outage is one event, not one per attempt
+            connect_failed_events = [
+                event
+                for event in coordinator.get_diagnostics()["events"]
+                if event["event"] == "connect_failed"
+            ]
+            assert len(connect_failed_events) == 1
+            assert connect_failed_events[0]["count"] > 1
+
+            # ... and succeed once the UAI+ comes back
+            await fake_uai_plus.async_start()
+            assert await fake_uai_plus.async_wait_until(
+                lambda: fake_uai_plus.session_count == 1
+            )
+            assert fake_uai_plus.open_connection_count == 1
+
+            await coordinator.async_disconnect()
+            await coordinator.async_shutdown()
+            assert await fake_uai_plus.async_wait_until(
+                lambda: fake_uai_plus.open_connection_count == 0
+            )
+        await fake_uai_plus.async_stop()
+
+    asyncio.run(async_soak())
+
+
+@pytest.mark.parametrize("dual_session", [False, True])
+def test_reload_cycles(integration, dual_session: bool) -> None:
+    """Repeatedly reloading a config entry leaves nothing behind."""
+    session_count = 2 if dual_session else 1
+
+    async def async_soak() -> None:
+        fake_uai_plus = FakeUaiPlus(integration.const.TELNET_PORT)
+        await fake_uai_plus.async_start()
+        async with async_home_assistant() as hass:
+            entry = await async_add_config_entry(
+                hass, TARGET_IDS, GROUP_IDS, dual_session=dual_session
+            )
+            assert entry.state is ConfigEntryState.LOADED
+            assert await fake_uai_plus.async_wait_until(
+                lambda: fake_uai_plus.session_count == session_count
+            )
+            device_registry = dr.async_get(hass)
+            entity_registry = er.async_get(hass)
+            device_count = len(
+                dr.async_entries_for_config_entry(device_registry, entry.entry_id)
+            )
+            entity_count = len(
+                er.async_entries_for_config_entry(entity_registry, entry.entry_id)
+            )
+            assert entity_count == len(TARGET_IDS) + len(GROUP_IDS) + 1
+
+            tracemalloc.start()
+            try:
+                for cycle in range(SOAK_CYCLES):
+                    if cycle == WARM_UP_CYCLES:
+                        baseline_tasks = await _async_settle(hass)
+                        baseline_memory = _traced_memory(integration)
+
+                    login_count = fake_uai_plus.login_count
+                    assert await hass.config_entries.async_reload(entry.entry_id)
+                    assert await fake_uai_plus.async_wait_until(
+                        lambda: fake_uai_plus.login_count >= login_count + session_count
+                    ), f"not reconnected after reload {cycle}"
+                    # The previous coordinator's sessions are all closed
+                    assert await fake_uai_plus.async_wait_until(
+                        lambda: fake_uai_plus.open_connection_count == session_count
+                    ), (
+                        f"{fake_uai_plus.open_connection_count} connections open "
+                        f"after reload {cycle}"
+                    )
+
+                tasks = await _async_settle(hass)
+                memory = _traced_memory(integration)
+            finally:
+                tracemalloc.stop()
+
+            assert entry.state is ConfigEntryState.LOADED
+            assert tasks - baseline_tasks <= MAX_TASK_GROWTH
+            assert memory - baseline_memory <= MAX_MEMORY_GROWTH_BYTES
+            assert device_count == len(
+                dr.async_entries_for_config_entry(device_registry, entry.entry_id)
+            )
+            assert entity_count == len(
+                er.async_entries_for_config_entry(entity_registry, entry.entry_id)
+            )
+            assert hass.services.has_service(DOMAIN, "move_covers")
+
+            assert await hass.config_entries.async_unload(entry.entry_id)
+            assert not hass.services.has_service(DOMAIN, "move_covers")
+            assert await fake_uai_plus.async_wait_until(
+                lambda: fake_uai_plus.open_connection_count == 0
+            )
+        await fake_uai_plus.async_stop()
+
+    asyncio.run(async_soak())